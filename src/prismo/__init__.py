@@ -2,18 +2,35 @@ __version__ = "0.1.0"
 
 __all__ = ["acq", "live", "load", "multi_acq", "tiled_acq", "utils"]
 
+import importlib
 import logging
+import os
 import sys
 
-from beartype import BeartypeConf
-from beartype.claw import beartype_this_package
-
 from prismo.control import load
-from prismo.run import acq, live, multi_acq, tiled_acq
 
 from . import utils
 
-beartype_this_package(conf=BeartypeConf(is_pep484_tower=True))
+# Runtime type checks add overhead to every annotated call, so they're opt-in.
+if os.environ.get("PRISMO_TYPECHECK") == "1":
+    from beartype import BeartypeConf
+    from beartype.claw import beartype_this_package
+
+    # The claw only checks modules imported after it's installed. prismo.run has always been
+    # loaded before it (and its hints don't admit test doubles), so keep it that way.
+    importlib.import_module("prismo.run")
+    beartype_this_package(conf=BeartypeConf(is_pep484_tower=True))
+
+# The acquisition functions pull in napari and Qt, so only import them once they're used.
+_LAZY = {"acq", "live", "multi_acq", "tiled_acq"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module("prismo.run"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class IndentFormatter(logging.Formatter):
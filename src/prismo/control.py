@@ -1,5 +1,9 @@
+import functools
+import math
 import os
 import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from pymmcore import CMMCore
@@ -8,6 +12,97 @@ import prismo.devices as dev
 
 control = None
 
+# Maps each device type in a config to a function returning its (uninitialized) constructor.
+_DEVICES: dict[str, Callable[[str, CMMCore, dict[str, Any]], functools.partial]] = {
+    "asi_stage": lambda name, core, params: functools.partial(dev.asi.Stage, name, **params),
+    "asi_zstage": lambda name, core, params: functools.partial(dev.asi.Focus, name, **params),
+    "bsi_camera": lambda name, core, params: functools.partial(
+        dev.bsi.Camera, name, core, **params
+    ),
+    "demo_camera": lambda name, core, params: functools.partial(dev.demo.Camera, name),
+    "demo_filter": lambda name, core, params: functools.partial(dev.demo.Filter, name, **params),
+    "demo_stage": lambda name, core, params: functools.partial(dev.demo.Stage, name),
+    "demo_valves": lambda name, core, params: functools.partial(dev.demo.Valves, name, **params),
+    "fluidic_sipper": lambda name, core, params: functools.partial(
+        dev.fluidic.Sipper, name, **params
+    ),
+    "lambda_filter1": lambda name, core, params: functools.partial(
+        dev.sutter.Filter, name, core, filter="A", **params
+    ),
+    "lambda_filter2": lambda name, core, params: functools.partial(
+        dev.sutter.Filter, name, core, filter="B", **params
+    ),
+    "lambda_filter3": lambda name, core, params: functools.partial(
+        dev.sutter.Filter, name, core, filter="C", **params
+    ),
+    "lambda_shutter1": lambda name, core, params: functools.partial(
+        dev.sutter.Shutter, name, core, shutter="A", **params
+    ),
+    "lambda_shutter2": lambda name, core, params: functools.partial(
+        dev.sutter.Shutter, name, core, shutter="B", **params
+    ),
+    "manual_objective": lambda name, core, params: functools.partial(
+        dev.manual.Objective, name, **params
+    ),
+    # The valve driver gets passed in once it's been initialized.
+    "microfluidic_chip": lambda name, core, params: functools.partial(
+        dev.microfluidic.Chip, name, **params
+    ),
+    "microfluidic_valves": lambda name, core, params: functools.partial(
+        dev.microfluidic.ValveDriver, name, **params
+    ),
+    "retra_light": lambda name, core, params: functools.partial(
+        dev.lumencor.RetraLight, name, core, **params
+    ),
+    "sola_light": lambda name, core, params: functools.partial(
+        dev.lumencor.SolaLight, name, core, version="sola", **params
+    ),
+    "spectra_light": lambda name, core, params: functools.partial(
+        dev.lumencor.SolaLight, name, core, version="spectra", **params
+    ),
+    "ti_filter1": lambda name, core, params: functools.partial(
+        dev.ti.Filter, name, core, filter=1, **params
+    ),
+    "ti_filter2": lambda name, core, params: functools.partial(
+        dev.ti.Filter, name, core, filter=2, **params
+    ),
+    "ti_lightpath": lambda name, core, params: functools.partial(
+        dev.ti.LightPath, name, core, **params
+    ),
+    "ti_focus": lambda name, core, params: functools.partial(dev.ti.Focus, name, core),
+    "ti_objective": lambda name, core, params: functools.partial(
+        dev.ti.Objective, name, core, **params
+    ),
+    "ti2_filter1": lambda name, core, params: functools.partial(
+        dev.ti2.Filter, name, core, filter=1, **params
+    ),
+    "ti2_filter2": lambda name, core, params: functools.partial(
+        dev.ti2.Filter, name, core, filter=2, **params
+    ),
+    "ti2_overheadlight": lambda name, core, params: functools.partial(
+        dev.ti2.OverheadLight, name, core, **params
+    ),
+    "ti2_shutter1": lambda name, core, params: functools.partial(
+        dev.ti2.Shutter, name, core, shutter=1
+    ),
+    "ti2_shutter2": lambda name, core, params: functools.partial(
+        dev.ti2.Shutter, name, core, shutter=2
+    ),
+    "ti2_lightpath": lambda name, core, params: functools.partial(
+        dev.ti2.LightPath, name, core, **params
+    ),
+    "ti2_lightselector": lambda name, core, params: functools.partial(
+        dev.ti2.LightSelector, name, core, **params
+    ),
+    "ti2_focus": lambda name, core, params: functools.partial(dev.ti2.Focus, name, core),
+    "ti2_objective": lambda name, core, params: functools.partial(
+        dev.ti2.Objective, name, core, **params
+    ),
+    "zyla_camera": lambda name, core, params: functools.partial(
+        dev.zyla.Camera, name, core, **params
+    ),
+}
+
 
 def load(
     config: dict[str, dict[str, Any] | str], path: str | None = None, singleton: bool = True
@@ -27,84 +122,15 @@ def load(
     os.environ["PATH"] += os.pathsep + path
     core.setDeviceAdapterSearchPaths([path])
 
-    devices = []
-    valves = None
+    inits: list[functools.partial] = []
     for name, params in config.items():
-        # TODO: Pull out valves so config isn't order dependent.
         params: dict[str, Any] = {"device": params} if isinstance(params, str) else params
         device = params.pop("device")
-        match device:
-            case "asi_stage":
-                devices.append(dev.asi.Stage(name, **params))
-            case "asi_zstage":
-                devices.append(dev.asi.Focus(name, **params))
-            case "bsi_camera":
-                devices.append(dev.bsi.Camera(name, core, **params))
-            case "demo_camera":
-                devices.append(dev.demo.Camera(name))
-            case "demo_filter":
-                devices.append(dev.demo.Filter(name, **params))
-            case "demo_stage":
-                devices.append(dev.demo.Stage(name))
-            case "demo_valves":
-                devices.append(dev.demo.Valves(name, **params))
-            case "fluidic_sipper":
-                devices.append(dev.fluidic.Sipper(name, **params))
-            case "lambda_filter1":
-                devices.append(dev.sutter.Filter(name, core, filter="A", **params))
-            case "lambda_filter2":
-                devices.append(dev.sutter.Filter(name, core, filter="B", **params))
-            case "lambda_filter3":
-                devices.append(dev.sutter.Filter(name, core, filter="C", **params))
-            case "lambda_shutter1":
-                devices.append(dev.sutter.Shutter(name, core, shutter="A", **params))
-            case "lambda_shutter2":
-                devices.append(dev.sutter.Shutter(name, core, shutter="B", **params))
-            case "manual_objective":
-                devices.append(dev.manual.Objective(name, **params))
-            case "microfluidic_chip":
-                devices.append(dev.microfluidic.Chip(name, valves, **params))
-            case "microfluidic_valves":
-                devices.append(dev.microfluidic.ValveDriver(name, **params))
-                valves = devices[-1]
-            case "retra_light":
-                devices.append(dev.lumencor.RetraLight(name, core, **params))
-            case "sola_light":
-                devices.append(dev.lumencor.SolaLight(name, core, version="sola", **params))
-            case "spectra_light":
-                devices.append(dev.lumencor.SolaLight(name, core, version="spectra", **params))
-            case "ti_filter1":
-                devices.append(dev.ti.Filter(name, core, filter=1, **params))
-            case "ti_filter2":
-                devices.append(dev.ti.Filter(name, core, filter=2, **params))
-            case "ti_lightpath":
-                devices.append(dev.ti.LightPath(name, core, **params))
-            case "ti_focus":
-                devices.append(dev.ti.Focus(name, core))
-            case "ti_objective":
-                devices.append(dev.ti.Objective(name, core, **params))
-            case "ti2_filter1":
-                devices.append(dev.ti2.Filter(name, core, filter=1, **params))
-            case "ti2_filter2":
-                devices.append(dev.ti2.Filter(name, core, filter=2, **params))
-            case "ti2_overheadlight":
-                devices.append(dev.ti2.OverheadLight(name, core, **params))
-            case "ti2_shutter1":
-                devices.append(dev.ti2.Shutter(name, core, shutter=1))
-            case "ti2_shutter2":
-                devices.append(dev.ti2.Shutter(name, core, shutter=2))
-            case "ti2_lightpath":
-                devices.append(dev.ti2.LightPath(name, core, **params))
-            case "ti2_lightselector":
-                devices.append(dev.ti2.LightSelector(name, core, **params))
-            case "ti2_focus":
-                devices.append(dev.ti2.Focus(name, core))
-            case "ti2_objective":
-                devices.append(dev.ti2.Objective(name, core, **params))
-            case "zyla_camera":
-                devices.append(dev.zyla.Camera(name, core, **params))
-            case _:
-                raise ValueError(f"Device {device} is not recognized.")
+        if device not in _DEVICES:
+            raise ValueError(f"Device {device} is not recognized.")
+        inits.append(_DEVICES[device](name, core, params))
+
+    devices = _init_devices(inits)
 
     if singleton:
         control = Control(core, devices=devices)
@@ -113,32 +139,78 @@ def load(
         return Control(core, devices=devices)
 
 
+def _init_devices(inits: list[functools.partial]) -> list[Any]:
+    # Devices from the same module often share a port or parent device so we initialize
+    # them sequentially, but separate modules can be brought up in parallel. MMCore isn't
+    # thread-safe, and vendor adapters expect to stay on the thread that loaded them, so every
+    # device that talks to the core is initialized on the calling thread.
+    devices: list[Any] = [None] * len(inits)
+    core_idxs: list[int] = []
+    groups: dict[str, list[int]] = {}
+    for i, init in enumerate(inits):
+        if init.func is dev.microfluidic.Chip:
+            continue
+        elif any(isinstance(arg, CMMCore) for arg in init.args):
+            core_idxs.append(i)
+        else:
+            groups.setdefault(init.func.__module__, []).append(i)
+
+    def init_group(idxs: list[int]):
+        for i in idxs:
+            devices[i] = inits[i]()
+
+    with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+        futures = [executor.submit(init_group, idxs) for idxs in groups.values()]
+        init_group(core_idxs)
+        for future in as_completed(futures):
+            if (e := future.exception()) is not None:
+                raise e
+
+    # Chips use the closest valve driver that precedes them in the config.
+    valves = None
+    for i, init in enumerate(inits):
+        if isinstance(devices[i], dev.microfluidic.ValveDriver):
+            valves = devices[i]
+        elif init.func is dev.microfluidic.Chip:
+            devices[i] = init(driver=valves)
+
+    return devices
+
+
 class Control:
     def __init__(self, core: CMMCore, devices: list[Any]):
-        # We can't directly set self.devices = devices since our overriden method
-        # depends on self.devices being set.
+        # Sort the devices out in a single pass rather than scanning the list once per role.
+        by_name: dict[str, Any] = {}
+        state_names: set[str] = set()
+        camera = stage = focus = None
+        zooms = []
+        for device in devices:
+            # The first device with a given name wins lookups.
+            if device.name not in by_name:
+                by_name[device.name] = device
+                if isinstance(device, dev.State):
+                    state_names.add(device.name)
+            if camera is None and isinstance(device, dev.Camera):
+                camera = device
+            if stage is None and isinstance(device, dev.Stage):
+                stage = device
+            if focus is None and isinstance(device, dev.Focus):
+                focus = device
+            if isinstance(device, dev.Zoom):
+                zooms.append(device)
+
+        # We can't directly set self.devices = devices since our overriden methods
+        # depend on these being set.
         super().__setattr__("devices", devices)
+        super().__setattr__("_by_name", by_name)
+        super().__setattr__("_state_names", state_names)
 
         self._core = core
         self._core.setTimeoutMs(100000)
-
-        self._camera = None
-        for device in self.devices:
-            if isinstance(device, dev.Camera):
-                self._camera = device
-                break
-
-        self._stage = None
-        for device in self.devices:
-            if isinstance(device, dev.Stage):
-                self._stage = device
-                break
-
-        self._focus = None
-        for device in self.devices:
-            if isinstance(device, dev.Focus):
-                self._focus = device
-                break
+        self._camera = camera
+        self._stage = stage
+        self._focus = focus
+        self._zooms = zooms
 
         weakref.finalize(self, self.close)
 
@@ -164,11 +236,7 @@ class Control:
 
     @property
     def px_len(self):
-        zoom_total = 1
-        for device in self.devices:
-            if isinstance(device, dev.Zoom):
-                zoom_total *= device.zoom
-        return self._camera.px_len / zoom_total
+        return self._camera.px_len / math.prod(device.zoom for device in self._zooms)
 
     @property
     def exposure(self):
@@ -235,20 +303,19 @@ class Control:
         self._stage.xy = new_xy
 
     def __getattr__(self, name):
-        for device in self.devices:
-            if name == device.name:
-                if isinstance(device, dev.State):
-                    return device.state
-                else:
-                    return device
-        return self.__getattribute__(name)
+        device = self._by_name.get(name)
+        if device is None:
+            return self.__getattribute__(name)
+        elif name in self._state_names:
+            return device.state
+        else:
+            return device
 
     def __setattr__(self, name, value):
-        for device in self.devices:
-            if name == device.name and isinstance(device, dev.State):
-                device.state = value
-                return
-        super().__setattr__(name, value)
+        if name in self._state_names:
+            self._by_name[name].state = value
+        else:
+            super().__setattr__(name, value)
 
     def close(self):
         self._core.reset()
@@ -1,118 +1,153 @@
-import numpy as np
+import re
+import time
 
 from .ports import Port
 
 VID = 0x10C4
 PID = 0xEA60
+# How long a position read is reused for before we query the controller again.
+XY_CACHE_TTL_S = 0.05
+# Longest we sleep between status polls while waiting for a move to finish.
+MAX_WAIT_POLL_S = 0.02
+
+_STATUS = b"/\r"
+_WHERE_XY = b"WHERE X Y\r"
+_WHERE_Z = b"WHERE Z\r"
+# Position replies look like ":A 1234.5 -678.9".
+_WHERE_XY_RE = re.compile(rb":A\s+([-+]?\d+(?:\.\d*)?)\s+([-+]?\d+(?:\.\d*)?)")
 
 
 class Stage:
+    __slots__ = ("name", "_port", "_xy_cache", "_xy_time")
+
     def __init__(self, name: str, port: str | None = None):
         self.name = name
         self._port = Port(VID, PID, port, baudrate=9600, timeout=2.0)
+        self._xy_cache: tuple[float, float] | None = None
+        self._xy_time = 0.0
 
-    def _cmd(self, cmd: str) -> str:
-        response = self._port.write_readline((cmd + "\r").encode()).decode().strip()
-        if response.startswith(":N"):
-            raise RuntimeError(f"ASI error: {response}")
+    def _cmd(self, cmd: bytes) -> bytes:
+        response = self._port.write_readline(cmd).strip()
+        if response.startswith(b":N"):
+            raise RuntimeError(f"ASI error: {response.decode()}")
         return response
 
+    def _where(self) -> tuple[float, float]:
+        now = time.monotonic()
+        if self._xy_cache is None or now - self._xy_time > XY_CACHE_TTL_S:
+            m = _WHERE_XY_RE.match(self._cmd(_WHERE_XY))
+            if m is None:
+                raise RuntimeError("ASI error: unexpected reply to WHERE X Y.")
+            self._xy_cache = (float(m[1]), float(m[2]))
+            self._xy_time = now
+        return self._xy_cache
+
     def wait(self):
-        while not self._cmd("/").startswith(":A"):
-            pass
+        # Back off between polls so long moves don't flood the controller with requests.
+        delay_s = 0.001
+        while not self._cmd(_STATUS).startswith(b":A"):
+            time.sleep(delay_s)
+            delay_s = min(2 * delay_s, MAX_WAIT_POLL_S)
+        self._xy_cache = None
 
     def close(self):
         self._port.close()
 
     @property
     def x(self) -> float:
-        resp = self._cmd("WHERE X")
-        return float(resp.split(" ")[1])
+        return self._where()[0]
 
     @x.setter
     def x(self, new_x: float):
-        self._cmd(f"MOVE X={float(new_x):.4f}")
+        self._xy_cache = None
+        self._cmd(b"MOVE X=%.4f\r" % new_x)
 
     @property
     def y(self) -> float:
-        resp = self._cmd("WHERE Y")
-        return float(resp.split(" ")[1])
+        return self._where()[1]
 
     @y.setter
     def y(self, new_y: float):
-        self._cmd(f"MOVE Y={float(new_y):.4f}")
+        self._xy_cache = None
+        self._cmd(b"MOVE Y=%.4f\r" % new_y)
 
     @property
-    def xy(self) -> np.ndarray:
-        resp = self._cmd("WHERE X Y").split(" ")
-        x, y = float(resp[1]), float(resp[2])
-        return np.array([x, y])
+    def xy(self) -> tuple[float, float]:
+        return self._where()
 
     @xy.setter
     def xy(self, new_xy: tuple[float, float]):
-        self._cmd(f"MOVE X={float(new_xy[0]):.4f} Y={float(new_xy[1]):.4f}")
+        self._xy_cache = None
+        self._cmd(b"MOVE X=%.4f Y=%.4f\r" % (new_xy[0], new_xy[1]))
 
     @property
     def x_speed(self) -> float:
-        resp = self._cmd("VE X?")
-        return float(resp.split("X=")[1].split()[0])
+        resp = self._cmd(b"VE X?\r")
+        return float(resp.split(b"X=")[1].split()[0])
 
     @x_speed.setter
     def x_speed(self, speed: float):
-        self._cmd(f"VE X={float(speed)}")
+        self._cmd(b"VE X=%.4f\r" % speed)
 
     @property
     def y_speed(self) -> float:
-        resp = self._cmd("VE Y?")
-        return float(resp.split("Y=")[1].split()[0])
+        resp = self._cmd(b"VE Y?\r")
+        return float(resp.split(b"Y=")[1].split()[0])
 
     @y_speed.setter
     def y_speed(self, speed: float):
-        self._cmd(f"VE Y={float(speed)}")
+        self._cmd(b"VE Y=%.4f\r" % speed)
 
     def set_xy_speed(self, vx: float, vy: float):
-        self._cmd(f"VE X={float(vx)} Y={float(vy)}")
+        self._cmd(b"VE X=%.4f Y=%.4f\r" % (vx, vy))
 
     def __iadd__(self, delta: tuple[float, float]) -> "Stage":
-        self._cmd(f"MOVREL X={float(delta[0]):.4f} Y={float(delta[1]):.4f}")
+        self._xy_cache = None
+        self._cmd(b"MOVREL X=%.4f Y=%.4f\r" % (delta[0], delta[1]))
         return self
 
     def __isub__(self, delta: tuple[float, float]) -> "Stage":
-        self._cmd(f"MOVREL X={-float(delta[0]):.4f} Y={-float(delta[1]):.4f}")
+        self._xy_cache = None
+        self._cmd(b"MOVREL X=%.4f Y=%.4f\r" % (-delta[0], -delta[1]))
         return self
 
 
 class Focus:
+    __slots__ = ("name", "_port")
+
     def __init__(self, name: str, port: str | None = None):
         self.name = name
         self._port = Port(VID, PID, port, baudrate=9600, timeout=2.0)
 
-    def _cmd(self, cmd: str) -> str:
-        response = self._port.write_readline((cmd + "\r").encode()).decode().strip()
-        if response.startswith(":N"):
-            raise RuntimeError(f"ASI error: {response}")
+    def _cmd(self, cmd: bytes) -> bytes:
+        response = self._port.write_readline(cmd).strip()
+        if response.startswith(b":N"):
+            raise RuntimeError(f"ASI error: {response.decode()}")
         return response
 
     def wait(self):
-        while not self._cmd("/").startswith(":A"):
-            pass
+        # Back off between polls so long moves don't flood the controller with requests.
+        delay_s = 0.001
+        while not self._cmd(_STATUS).startswith(b":A"):
+            time.sleep(delay_s)
+            delay_s = min(2 * delay_s, MAX_WAIT_POLL_S)
 
     def close(self):
         self._port.close()
 
     @property
     def z(self) -> float:
-        resp = self._cmd("WHERE Z")
-        return float(resp.split(" ")[1])
+        resp = self._cmd(_WHERE_Z)
+        return float(resp.split(b" ")[1])
 
     @z.setter
     def z(self, new_z: float):
-        self._cmd(f"MOVE Z={float(new_z):.4f}")
+        self._cmd(b"MOVE Z=%.4f\r" % new_z)
 
     def __iadd__(self, delta: float) -> "Focus":
-        self._cmd(f"MOVREL Z={float(delta):.4f}")
+        self._cmd(b"MOVREL Z=%.4f\r" % delta)
         return self
 
     def __isub__(self, delta: float) -> "Focus":
-        self._cmd(f"MOVREL Z={-float(delta):.4f}")
+        self._cmd(b"MOVREL Z=%.4f\r" % -delta)
         return self
@@ -5,37 +5,40 @@ from pymmcore import CMMCore
 
 
 class Camera:
+    __slots__ = ("name", "_core", "_flip_slice", "_binning")
+
     def __init__(
         self, name: str, core: CMMCore, flip: Literal["none", "ud", "lr", "both"] = "none"
     ):
         self.name = name
         self._core = core
-        self._flip = flip
+        self._flip_slice = {
+            "none": (slice(None), slice(None)),
+            "ud": (slice(None, None, -1), slice(None)),
+            "lr": (slice(None), slice(None, None, -1)),
+            "both": (slice(None, None, -1), slice(None, None, -1)),
+        }[flip]
         core.loadDevice(name, "PVCAM", "Camera-1")
         core.initializeDevice(name)
+        # Binning only changes through our setter so we avoid querying it on every px_len.
+        self._binning = int(core.getProperty(name, "Binning")[-1])
 
     def snap(self) -> np.ndarray:
         self._core.setCameraDevice(self.name)
         self._core.snapImage()
-        img = self._core.getImage()
-        if self._flip == "ud":
-            img = np.flipud(img)
-        elif self._flip == "lr":
-            img = np.fliplr(img)
-        elif self._flip == "both":
-            img = np.flipud(np.fliplr(img))
-        return img
+        return self._core.getImage()[self._flip_slice]
 
     def wait(self):
         self._core.waitForDevice(self.name)
 
     @property
     def binning(self) -> int:
-        return int(self._core.getProperty(self.name, "Binning")[-1])
+        return self._binning
 
     @binning.setter
     def binning(self, new_binning: int):
         self._core.setProperty(self.name, "Binning", f"{new_binning}x{new_binning}")
+        self._binning = int(new_binning)
 
     @property
     def exposure(self) -> float:
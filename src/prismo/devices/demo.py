@@ -12,19 +12,22 @@ class Camera:
     def __init__(self, name: str, shape: tuple[int, int] = (512, 512)):
         self.name = name
         self._shape = shape
+        self._xs = np.arange(shape[1]) / 20
+        self._ys = np.arange(shape[0]) / 20
 
     def snap(self) -> np.ndarray:
         t = time.time()
-        y, x = np.ogrid[: self._shape[0], : self._shape[1]]
-        # Sine wave that shifts with time, position, and filter state
+        # Sine wave that shifts with time, position, and filter state. The wave is separable
+        # so we only evaluate sin along each axis and take the outer product.
         phase = _filter_state * np.pi / 2
         freq = 1 + _filter_state * 0.2
-        img = np.sin(x / 20 * freq + t + _x / 100 + phase) * np.sin(
-            y / 20 * freq + t * 0.7 + _y / 100
-        )
+        wave_x = np.sin(self._xs * freq + t + _x / 100 + phase)
+        wave_y = np.sin(self._ys * freq + t * 0.7 + _y / 100)
+        img = np.multiply.outer(wave_y, wave_x)
         # Normalize to uint16 range
-        img = ((img + 1) / 2 * 65535).astype(np.uint16)
-        return img
+        img += 1
+        img *= 65535 / 2
+        return img.astype(np.uint16)
 
     def wait(self):
         pass
@@ -1,3 +1,4 @@
+import contextlib
 import math
 import re
 import struct
@@ -9,6 +10,21 @@ from . import packet
 
 STEPS_PER_MM = 4096 / (math.pi * 24)
 
+# Requests are mostly a bare code or a code followed by a double.
+_CODE = struct.Struct(">B")
+_CODE_F64 = struct.Struct(">Bd")
+_CODE_BOOL = struct.Struct(">B?")
+_SET_POS = struct.Struct(">Bqqq")
+# Reply payloads, which follow the echoed code.
+_NONE = struct.Struct(">")
+_BOOL = struct.Struct(">?")
+_U16 = struct.Struct(">H")
+_F64 = struct.Struct(">d")
+_POS = struct.Struct(">qqq")
+_HISTORY_HEADER = struct.Struct(">BH")
+# Wells are a row letter followed by a column number, e.g. "A1".
+_WELL_RE = re.compile(r"[A-Za-z]\d+")
+
 
 class Code(IntEnum):
     # Pump codes.
@@ -44,7 +60,28 @@ class Code(IntEnum):
     FAIL = 0xFF
 
 
+# Requests without arguments are just their code so build them once.
+_REQ = {code: _CODE.pack(code) for code in Code}
+# Likewise the valve only has two possible requests, indexed by whether it's set to flow.
+_SET_VALVE_REQ = (_CODE_BOOL.pack(Code.SET_VALVE, False), _CODE_BOOL.pack(Code.SET_VALVE, True))
+
+
 class Sipper:
+    __slots__ = (
+        "name",
+        "_socket",
+        "_ul_per_min",
+        "_origin",
+        "_rows",
+        "_cols",
+        "_well_dist",
+        "_well_xy",
+        "_sip_rpm",
+        "_flush_rpm",
+        "_xyz",
+        "_pending",
+    )
+
     def __init__(
         self,
         name: str,
@@ -63,35 +100,42 @@ class Sipper:
         self._rows = rows
         self._cols = cols
         self._well_dist = well_dist
+        # Plates are small so we work out where every well is up front.
+        self._well_xy = {
+            f"{chr(ord('A') + row)}{col + 1}": (col * well_dist, (rows - 1 - row) * well_dist)
+            for row in range(rows)
+            for col in range(cols)
+        }
         self._sip_rpm = sip_rpm
-        self.flush_time = flush_time
-        self.flush_rpm = flush_rpm
-        self.rms_amps = 0.3
+        # Codes of setter requests we've sent inside a batch but haven't read the replies to.
+        self._pending: list[int] | None = None
+        with self.batch():
+            self.flush_time = flush_time
+            self.flush_rpm = flush_rpm
+            self.rms_amps = 0.3
+        # Last position we moved to, so single axis moves don't need to query the others.
+        self._xyz: tuple[float, float, float] | None = None
         self.home()
 
     @property
     def air(self) -> bool:
-        request = struct.pack(">B", Code.GET_AIR_IN_LINE)
-        self._socket.write(request)
-        return self._read(Code.GET_AIR_IN_LINE, "?")
+        request = _REQ[Code.GET_AIR_IN_LINE]
+        return self._transact(request, Code.GET_AIR_IN_LINE, _BOOL)
 
     @property
     def flow_rate(self) -> float:
-        request = struct.pack(">B", Code.GET_FLOW_RATE)
-        self._socket.write(request)
-        return self._read(Code.GET_FLOW_RATE, "d")
+        request = _REQ[Code.GET_FLOW_RATE]
+        return self._transact(request, Code.GET_FLOW_RATE, _F64)
 
     @property
     def rpm(self) -> float:
-        request = struct.pack(">B", Code.GET_PUMP_RPM)
-        self._socket.write(request)
-        return -self._read(Code.GET_PUMP_RPM, "d")
+        request = _REQ[Code.GET_PUMP_RPM]
+        return -self._transact(request, Code.GET_PUMP_RPM, _F64)
 
     @rpm.setter
     def rpm(self, rpm: float):
-        request = struct.pack(">Bd", Code.SET_PUMP_RPM, -rpm)
-        self._socket.write(request)
-        self._read(Code.SET_PUMP_RPM)
+        request = _CODE_F64.pack(Code.SET_PUMP_RPM, -rpm)
+        self._transact(request, Code.SET_PUMP_RPM)
 
     @property
     def ul_per_min(self) -> float:
@@ -99,136 +143,119 @@ class Sipper:
 
     @ul_per_min.setter
     def ul_per_min(self, ul_per_min: float):
-        request = struct.pack(">Bd", Code.SET_FLOW_UL_PER_MIN, ul_per_min)
-        self._socket.write(request)
-        self._read(Code.SET_FLOW_UL_PER_MIN)
+        request = _CODE_F64.pack(Code.SET_FLOW_UL_PER_MIN, ul_per_min)
+        self._transact(request, Code.SET_FLOW_UL_PER_MIN)
         self._ul_per_min = float(ul_per_min)
 
     @property
     def rms_amps(self) -> float:
-        request = struct.pack(">B", Code.GET_RMS_AMPS)
-        self._socket.write(request)
-        return self._read(Code.GET_RMS_AMPS, "d")
+        request = _REQ[Code.GET_RMS_AMPS]
+        return self._transact(request, Code.GET_RMS_AMPS, _F64)
 
     @rms_amps.setter
     def rms_amps(self, amps: float):
-        request = struct.pack(">Bd", Code.SET_RMS_AMPS, amps)
-        self._socket.write(request)
-        self._read(Code.SET_RMS_AMPS)
+        request = _CODE_F64.pack(Code.SET_RMS_AMPS, amps)
+        self._transact(request, Code.SET_RMS_AMPS)
 
     @property
     def stop_rms_amps(self) -> float:
-        request = struct.pack(">B", Code.GET_STOP_RMS_AMPS)
-        self._socket.write(request)
-        return self._read(Code.GET_STOP_RMS_AMPS, "d")
+        request = _REQ[Code.GET_STOP_RMS_AMPS]
+        return self._transact(request, Code.GET_STOP_RMS_AMPS, _F64)
 
     @stop_rms_amps.setter
     def stop_rms_amps(self, amps: float):
-        request = struct.pack(">Bd", Code.SET_STOP_RMS_AMPS, amps)
-        self._socket.write(request)
-        self._read(Code.SET_STOP_RMS_AMPS)
+        request = _CODE_F64.pack(Code.SET_STOP_RMS_AMPS, amps)
+        self._transact(request, Code.SET_STOP_RMS_AMPS)
 
     @property
     def motor_load(self) -> int:
-        request = struct.pack(">B", Code.GET_MOTOR_LOAD)
-        self._socket.write(request)
-        return self._read(Code.GET_MOTOR_LOAD, "H")
+        request = _REQ[Code.GET_MOTOR_LOAD]
+        return self._transact(request, Code.GET_MOTOR_LOAD, _U16)
 
     def flow_history(self) -> list[float]:
-        request = struct.pack(">B", Code.GET_FLOW_HISTORY)
-        self._socket.write(request)
-        response = self._socket.read()
-        code, length = struct.unpack(">BH", response[:3])
+        request = _REQ[Code.GET_FLOW_HISTORY]
+        with self._socket.lock:
+            self._drain()
+            response = self._socket.transact(request)
+        code, length = _HISTORY_HEADER.unpack_from(response)
         if code != Code.GET_FLOW_HISTORY:
             raise RuntimeError(f"Expected {Code.GET_FLOW_HISTORY} got {code=}.")
-        return list(struct.unpack(f">{length}d", response[3:]))
+        return list(struct.unpack(f">{length}d", memoryview(response)[3:]))
 
     @property
     def valve(self) -> Literal["flow", "waste"]:
-        request = struct.pack(">B", Code.GET_VALVE)
-        self._socket.write(request)
-        return "flow" if self._read(Code.GET_VALVE, "?") else "waste"
+        request = _REQ[Code.GET_VALVE]
+        return "flow" if self._transact(request, Code.GET_VALVE, _BOOL) else "waste"
 
     @valve.setter
     def valve(self, dir: Literal["flow", "waste"]):
-        request = struct.pack(">B?", Code.SET_VALVE, dir == "flow")
-        self._socket.write(request)
-        self._read(Code.SET_VALVE)
+        request = _SET_VALVE_REQ[dir == "flow"]
+        self._transact(request, Code.SET_VALVE)
 
     @property
     def flush_time(self) -> float:
-        request = struct.pack(">B", Code.GET_FLUSH_TIME)
-        self._socket.write(request)
-        return self._read(Code.GET_FLUSH_TIME, "d")
+        request = _REQ[Code.GET_FLUSH_TIME]
+        return self._transact(request, Code.GET_FLUSH_TIME, _F64)
 
     @flush_time.setter
     def flush_time(self, seconds: float):
-        request = struct.pack(">Bd", Code.SET_FLUSH_TIME, seconds)
-        self._socket.write(request)
-        self._read(Code.SET_FLUSH_TIME)
+        request = _CODE_F64.pack(Code.SET_FLUSH_TIME, seconds)
+        self._transact(request, Code.SET_FLUSH_TIME)
 
     @property
     def flush_rpm(self) -> float:
-        request = struct.pack(">B", Code.GET_FLUSH_RPM)
-        self._socket.write(request)
-        return -self._read(Code.GET_FLUSH_RPM, "d")
+        request = _REQ[Code.GET_FLUSH_RPM]
+        return -self._transact(request, Code.GET_FLUSH_RPM, _F64)
 
     @flush_rpm.setter
     def flush_rpm(self, rpm: float):
-        request = struct.pack(">Bd", Code.SET_FLUSH_RPM, -rpm)
-        self._socket.write(request)
-        self._read(Code.SET_FLUSH_RPM)
+        request = _CODE_F64.pack(Code.SET_FLUSH_RPM, -rpm)
+        self._transact(request, Code.SET_FLUSH_RPM)
+        self._flush_rpm = float(rpm)
 
     @property
     def flushing(self) -> bool:
-        request = struct.pack(">B", Code.GET_FLUSHING)
-        self._socket.write(request)
-        return self._read(Code.GET_FLUSHING, "?")
+        request = _REQ[Code.GET_FLUSHING]
+        return self._transact(request, Code.GET_FLUSHING, _BOOL)
 
     def home(self):
-        request = struct.pack(">B", Code.HOME)
-        self._socket.write(request)
-        self._read(Code.HOME)
+        self._xyz = None
+        request = _REQ[Code.HOME]
+        self._transact(request, Code.HOME)
         while self.homing:
             time.sleep(0.01)
 
     @property
     def homing(self) -> bool:
-        request = struct.pack(">B", Code.IS_HOMING)
-        self._socket.write(request)
-        return self._read(Code.IS_HOMING, "?")
+        request = _REQ[Code.IS_HOMING]
+        return self._transact(request, Code.IS_HOMING, _BOOL)
 
     @property
     def cnc_speed(self) -> float:
         """Max speed in mm/s."""
-        request = struct.pack(">B", Code.GET_SPEED)
-        self._socket.write(request)
-        return self._read(Code.GET_SPEED, "d") / STEPS_PER_MM
+        request = _REQ[Code.GET_SPEED]
+        return self._transact(request, Code.GET_SPEED, _F64) / STEPS_PER_MM
 
     @cnc_speed.setter
     def cnc_speed(self, value: float):
-        request = struct.pack(">Bd", Code.SET_SPEED, value * STEPS_PER_MM)
-        self._socket.write(request)
-        self._read(Code.SET_SPEED)
+        request = _CODE_F64.pack(Code.SET_SPEED, value * STEPS_PER_MM)
+        self._transact(request, Code.SET_SPEED)
 
     @property
     def cnc_accel(self) -> float:
         """Acceleration in mm/s²."""
-        request = struct.pack(">B", Code.GET_ACCEL)
-        self._socket.write(request)
-        return self._read(Code.GET_ACCEL, "d") / STEPS_PER_MM
+        request = _REQ[Code.GET_ACCEL]
+        return self._transact(request, Code.GET_ACCEL, _F64) / STEPS_PER_MM
 
     @cnc_accel.setter
     def cnc_accel(self, value: float):
-        request = struct.pack(">Bd", Code.SET_ACCEL, value * STEPS_PER_MM)
-        self._socket.write(request)
-        self._read(Code.SET_ACCEL)
+        request = _CODE_F64.pack(Code.SET_ACCEL, value * STEPS_PER_MM)
+        self._transact(request, Code.SET_ACCEL)
 
     @property
     def xyz(self) -> tuple[float, float, float]:
-        request = struct.pack(">B", Code.GET_POS)
-        self._socket.write(request)
-        sx, sy, sz = self._read(Code.GET_POS, "qqq")
+        request = _REQ[Code.GET_POS]
+        sx, sy, sz = self._transact(request, Code.GET_POS, _POS)
         cx, cy, cz = sx / STEPS_PER_MM, sy / STEPS_PER_MM, sz / STEPS_PER_MM
         return (self._origin[0] - cx, cy - self._origin[1], self._origin[2] - cz)
 
@@ -236,14 +263,16 @@ class Sipper:
     def xyz(self, xyz: tuple[float, float, float]):
         cnc = (self._origin[0] - xyz[0], xyz[1] + self._origin[1], self._origin[2] - xyz[2])
         target = tuple(round(v * STEPS_PER_MM) for v in cnc)
-        request = struct.pack(">Bqqq", Code.SET_POS, *target)
-        self._socket.write(request)
-        self._read(Code.SET_POS)
-        request = struct.pack(">B", Code.GET_POS)
-        self._socket.write(request)
-        while self._read(Code.GET_POS, "qqq") != target:
+        self._xyz = None
+        request = _SET_POS.pack(Code.SET_POS, *target)
+        self._transact(request, Code.SET_POS)
+        request = _REQ[Code.GET_POS]
+        while self._transact(request, Code.GET_POS, _POS) != target:
             time.sleep(0.01)
-            self._socket.write(request)
+        self._xyz = (xyz[0], xyz[1], xyz[2])
+
+    def _last_xyz(self) -> tuple[float, float, float]:
+        return self.xyz if self._xyz is None else self._xyz
 
     @property
     def x(self) -> float:
@@ -251,7 +280,7 @@ class Sipper:
 
     @x.setter
     def x(self, value: float):
-        _, y, z = self.xyz
+        _, y, z = self._last_xyz()
         self.xyz = (value, y, z)
 
     @property
@@ -260,7 +289,7 @@ class Sipper:
 
     @y.setter
     def y(self, value: float):
-        x, _, z = self.xyz
+        x, _, z = self._last_xyz()
         self.xyz = (x, value, z)
 
     @property
@@ -269,15 +298,15 @@ class Sipper:
 
     @z.setter
     def z(self, value: float):
-        x, y, _ = self.xyz
+        x, y, _ = self._last_xyz()
         self.xyz = (x, y, value)
 
     @property
     def well(self) -> str:
-        x, y, _ = self.xyz
+        x, y, z = self.xyz
         col = round(x / self._well_dist)
         row = self._rows - 1 - round(y / self._well_dist)
-        if not (0 <= col < self._cols and 0 <= row < self._rows) or self.z >= 1.0:
+        if not (0 <= col < self._cols and 0 <= row < self._rows) or z >= 1.0:
             return ""
         return f"{chr(ord('A') + row)}{col + 1}"
 
@@ -286,52 +315,100 @@ class Sipper:
         if not well:
             self.z = self._origin[2]
             return
-        if not re.fullmatch(r"[A-Za-z]\d+", well):
-            raise ValueError(f"Invalid well format {well!r}, expected e.g. 'A1'.")
-
-        # Convert well string to 0-indexed row/col.
-        row = ord(well[0].upper()) - ord("A")
-        col = int(well[1:]) - 1
-        if not (0 <= row < self._rows and 0 <= col < self._cols):
-            raise ValueError(f"Well {well!r} is outside the {self._rows}x{self._cols} plate.")
+        xy = self._well_xy.get(well.upper())
+        if xy is None:
+            # Either the well is malformed, outside the plate, or written unusually (e.g. "A01").
+            if not _WELL_RE.fullmatch(well):
+                raise ValueError(f"Invalid well format {well!r}, expected e.g. 'A1'.")
+            xy = self._well_xy.get(f"{well[0].upper()}{int(well[1:])}")
+            if xy is None:
+                raise ValueError(f"Well {well!r} is outside the {self._rows}x{self._cols} plate.")
 
         # Lift sipper up.
         self.z = self._origin[2]
         # Move sipper over the well.
-        x = col * self._well_dist
-        y = (self._rows - 1 - row) * self._well_dist
-        self.xyz = (x, y, self._origin[2])
-        # Put sipper down.
-        self.z = 0.0
+        self.xyz = (xy[0], xy[1], self._origin[2])
+        # Put sipper down. We already know where we are so skip the position read in self.z.
+        self.xyz = (xy[0], xy[1], 0.0)
 
     def sip(self, well: str):
         # Move the sipper up.
         self.well = ""
         # Clear out the line of any liquid.
-        self.valve = "waste"
-        self.rpm = self.flush_rpm
+        with self.batch():
+            self.valve = "waste"
+            # Only our setter changes the flush rpm so we don't need to ask the device for it.
+            self.rpm = self._flush_rpm
         while not self.air:
             time.sleep(0.01)
         # Move to the new well and sip liquid.
         self.well = well
-        self.rpm = self._sip_rpm
-        self.valve = "flow"
+        with self.batch():
+            self.rpm = self._sip_rpm
+            self.valve = "flow"
         # Wait until the MCU autoflushes until we get to this well's liquid.
         while self.flushing:
             time.sleep(0.01)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Send setter requests without waiting on each reply and check them all at the end."""
+        with self._socket.lock:
+            if self._pending is not None:
+                yield self
+                return
+            self._pending = []
+            try:
+                yield self
+            finally:
+                try:
+                    self._drain()
+                finally:
+                    self._pending = None
+
     def close(self):
         self._socket.close()
 
-    def _read(self, assert_code: int, response_format: str = "") -> Any:
-        response = self._socket.read()
-        code = struct.unpack(">B", response[:1])[0]
+    def _drain(self):
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        error = None
+        for code in pending:
+            # Keep reading after a failure so the next reply we read is the one we expect.
+            try:
+                self._decode(self._socket.read(), code)
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+    def _transact(
+        self, request: bytes, assert_code: int, response_format: struct.Struct = _NONE
+    ) -> Any:
+        # Only the thread running a batch can see it in progress since it holds the lock.
+        with self._socket.lock:
+            if self._pending is not None:
+                if response_format is _NONE:
+                    self._socket.write(request)
+                    self._pending.append(assert_code)
+                    return ()
+                # We need this reply now so catch up on the ones we skipped first.
+                self._drain()
+            response = self._socket.transact(request)
+        return self._decode(response, assert_code, response_format)
+
+    def _decode(
+        self, response: bytearray, assert_code: int, response_format: struct.Struct = _NONE
+    ) -> Any:
+        code = response[0]
         if code == 0xFF:
             raise RuntimeError("Device reported failure.")
         elif code != assert_code:
             raise RuntimeError(f"Expected {assert_code} got {code=}.")
 
-        payload = struct.unpack(">" + response_format, response[1:])
+        payload = response_format.unpack(memoryview(response)[1:])
         if len(payload) == 1:
             return payload[0]
         else:
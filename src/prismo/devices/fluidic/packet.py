@@ -1,8 +1,8 @@
+import threading
 import weakref
 from collections.abc import Buffer
 
-from serial.tools import list_ports
-
+from .. import utils
 from ..ports import Port
 
 VID = 0x303A
@@ -10,21 +10,27 @@ PID = 0x1001
 
 
 class PacketStream:
+    __slots__ = ("_port", "_buf", "lock", "__weakref__")
+
     def __init__(self, device_id: int, timeout_s: int = 1):
         device_found = False
-        for p in list_ports.comports():
-            if p.vid == VID and p.pid == PID:
-                self._port = Port(port=p.device, baudrate=115200, timeout=timeout_s)
-                try:
-                    self._port.reset_input_buffer()
-                    self.write(bytes([0]))
-                    result = self.read()
-                    if len(result) == 2 and result[0] == 0 and result[1] == device_id:
-                        device_found = True
-                        break
-                except Exception:
-                    pass
-                self._port.close()
+        # Bytes we've pulled off the port but haven't consumed yet.
+        self._buf = bytearray()
+        # Held for a whole request/reply exchange. Callers can hold it across several.
+        self.lock = threading.RLock()
+        for device in utils.find_ports(VID, PID):
+            self._port = Port(port=device, baudrate=115200, timeout=timeout_s)
+            try:
+                self._port.reset_input_buffer()
+                self._buf.clear()
+                self.write(bytes([0]))
+                result = self.read()
+                if len(result) == 2 and result[0] == 0 and result[1] == device_id:
+                    device_found = True
+                    break
+            except Exception:
+                pass
+            self._port.close()
         if not device_found:
             raise ConnectionError(f"Could not find device with id {device_id}.")
 
@@ -51,7 +57,7 @@ class PacketStream:
             out[offset_idx] = offset
             out.append(0)
 
-        self._port.write(bytes(out))
+        self._port.write(out)
 
     def read(self) -> bytearray:
         size = 0
@@ -59,27 +65,50 @@ class PacketStream:
             size = self._timeout_read(1)[0]
 
         out = bytearray()
-        while size != 0:
-            buf = self._timeout_read(size - 1)
-            if any(b == 0 for b in buf):
-                while self._timeout_read(1)[0] != 0:
-                    pass
+        while True:
+            # Each block's data is followed by the next block's size (or the delimiter) so we
+            # pull both in with a single read.
+            buf = self._timeout_read(size)
+            next_size = buf[-1]
+            if buf.find(0, 0, -1) >= 0:
+                # Skip to the end of this packet so the next read starts on a fresh one.
+                if next_size != 0:
+                    self._skip_packet()
                 raise ValueError("Received unexpected zero byte in packet data.")
-            out.extend(buf)
-            prev_size = size
-            size = self._timeout_read(1)[0]
-            if size == 0:
+            out += memoryview(buf)[:-1]
+            if next_size == 0:
                 break
-            elif prev_size != 255:
+            elif size != 255:
                 out.append(0)
+            size = next_size
 
         return out
 
-    def _timeout_read(self, size: int) -> bytes:
-        out = self._port.read(size)
-        if len(out) < size:
-            raise TimeoutError("Read timed out.")
+    def transact(self, request: Buffer) -> bytearray:
+        # Hold the stream for the whole exchange so concurrent callers can't steal our reply.
+        with self.lock:
+            self.write(request)
+            return self.read()
+
+    def _timeout_read(self, size: int) -> bytearray:
+        if len(self._buf) < size:
+            # Grab anything else that's already arrived so back to back replies share a read.
+            self._buf += self._port.read(max(size - len(self._buf), self._port.in_waiting))
+            if len(self._buf) < size:
+                self._buf.clear()
+                raise TimeoutError("Read timed out.")
+        out = self._buf[:size]
+        del self._buf[:size]
         return out
 
+    def _skip_packet(self):
+        end = self._buf.find(0)
+        if end >= 0:
+            del self._buf[: end + 1]
+            return
+        self._buf.clear()
+        if not self._port.read_until(b"\x00").endswith(b"\x00"):
+            raise TimeoutError("Read timed out.")
+
     def close(self):
         self._port.close()
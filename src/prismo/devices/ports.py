@@ -1,8 +1,11 @@
+import contextlib
 import threading
 import weakref
+from collections.abc import Buffer
 
 import serial
-from serial.tools import list_ports
+
+from . import utils
 
 _serials: dict[str, serial.Serial] = {}
 _refcounts: dict[str, int] = {}
@@ -10,6 +13,13 @@ _locks: dict[str, threading.Lock] = {}
 _class_lock = threading.Lock()
 
 
+def _set_low_latency(s: serial.Serial):
+    # USB-serial adapters on Linux hold short replies for up to 16ms before handing them to us
+    # unless the port is in low latency mode. Not every platform or driver supports this.
+    with contextlib.suppress(AttributeError, NotImplementedError, ValueError):
+        s.set_low_latency_mode(True)
+
+
 class Port:
     def __init__(
         self, vid: int | None = None, pid: int | None = None, port: str | None = None, **kwargs
@@ -17,16 +27,25 @@ class Port:
         if port is None:
             if vid is None or pid is None:
                 raise ValueError("Either port or both vid and pid must be provided.")
-            for p in list_ports.comports():
-                if p.vid == vid and p.pid == pid:
-                    port = p.device
-                    break
-        if port is None:
-            raise ValueError(f"No port found with {vid=:#x} and {pid=:#x}")
+            ports = utils.find_ports(vid, pid)
+            if not ports:
+                raise ValueError(f"No port found with {vid=:#x} and {pid=:#x}")
+            port = ports[0]
 
         with _class_lock:
             if port not in _serials:
-                _serials[port] = serial.Serial(port, **kwargs)
+                try:
+                    _serials[port] = serial.Serial(port, **kwargs)
+                except serial.SerialException:
+                    # Our cached scan may be stale so make sure the next attempt rescans.
+                    if vid is not None and pid is not None:
+                        utils.invalidate_ports(vid, pid)
+                    raise
+                _set_low_latency(_serials[port])
+                # Drop anything the device sent before we opened it (e.g. boot banners) so the
+                # first reply we read is actually a reply to our first command.
+                _serials[port].reset_input_buffer()
+                _serials[port].reset_output_buffer()
                 _refcounts[port] = 0
                 _locks[port] = threading.Lock()
             _refcounts[port] += 1
@@ -35,7 +54,7 @@ class Port:
         self._closed = False
         weakref.finalize(self, self.close)
 
-    def write(self, data: bytes):
+    def write(self, data: Buffer):
         with _locks[self._name]:
             _serials[self._name].write(data)
 
@@ -43,6 +62,10 @@ class Port:
         with _locks[self._name]:
             return _serials[self._name].read(size)
 
+    def read_until(self, expected: bytes) -> bytes:
+        with _locks[self._name]:
+            return _serials[self._name].read_until(expected)
+
     def readline(self) -> bytes:
         with _locks[self._name]:
             return _serials[self._name].readline()
@@ -52,6 +75,11 @@ class Port:
             _serials[self._name].write(data)
             return _serials[self._name].readline()
 
+    @property
+    def in_waiting(self) -> int:
+        with _locks[self._name]:
+            return _serials[self._name].in_waiting
+
     def reset_input_buffer(self):
         with _locks[self._name]:
             _serials[self._name].reset_input_buffer()
@@ -1,9 +1,42 @@
 import re
+import threading
+import time
 from typing import Literal
 
 from pymmcore import CMMCore
 from serial.tools import list_ports
 
+# Enumerating USB devices is slow so devices loaded together share a single scan.
+_PORT_CACHE_TTL_S = 5.0
+_PORT_CACHE: dict[tuple[int, int], tuple[float, list[str]]] = {}
+# Devices are loaded from several threads so lookups and scans are serialized.
+_port_lock = threading.Lock()
+
+
+def find_ports(vid: int, pid: int) -> list[str]:
+    key = (vid, pid)
+    with _port_lock:
+        if key in _PORT_CACHE:
+            timestamp, ports = _PORT_CACHE[key]
+            if time.monotonic() - timestamp < _PORT_CACHE_TTL_S:
+                # Hand out a copy so callers can't modify the cache.
+                return list(ports)
+
+        timestamp = time.monotonic()
+        scanned: dict[tuple[int, int], list[str]] = {}
+        for p in list_ports.comports():
+            if p.vid is not None and p.pid is not None:
+                scanned.setdefault((p.vid, p.pid), []).append(p.device)
+        _PORT_CACHE.clear()
+        for k, v in scanned.items():
+            _PORT_CACHE[k] = (timestamp, v)
+        return list(scanned.get(key, []))
+
+
+def invalidate_ports(vid: int, pid: int):
+    with _port_lock:
+        _PORT_CACHE.pop((vid, pid), None)
+
 
 def load_port(
     core: CMMCore,
@@ -23,30 +56,34 @@ def load_port(
 ) -> str:
     # If an explicit port ID wasn't provided then just look for one that matches vid/pid.
     if port is None:
-        for p in list_ports.comports():
-            if p.vid == vid and p.pid == pid:
-                port = p.device
-                break
-
-    if port is None:
-        raise ValueError(f"No port found with {vid=} and {pid=}")
+        ports = find_ports(vid, pid)
+        if not ports:
+            raise ValueError(f"No port found with {vid=} and {pid=}")
+        port = ports[0]
 
     # Only initialize the port if it hasn't already been loaded by another device.
     if port not in core.getLoadedDevices():
-        core.loadDevice(port, "SerialManager", port)
+        try:
+            core.loadDevice(port, "SerialManager", port)
+        except Exception:
+            # Our cached scan may be stale so make sure the next attempt rescans.
+            invalidate_ports(vid, pid)
+            raise
         # Set port configurations before initializing.
-        core.setProperty(port, "AnswerTimeout", timeout_ms)
-        core.setProperty(port, "BaudRate", baud_rate)
-        core.setProperty(port, "DTR", "Enable" if dtr else "Disable")
-        core.setProperty(port, "DataBits", data_bits)
-        core.setProperty(port, "DelayBetweenCharsMs", char_delay_ms)
-        core.setProperty(port, "Fast USB to Serial", "Enable" if fast_usb else "Disable")
-        core.setProperty(
-            port, "Handshaking", "Off" if handshake == "none" else handshake.capitalize()
-        )
-        core.setProperty(port, "Parity", parity.capitalize())
-        core.setProperty(port, "StopBits", str(stop_bits))
-        core.setProperty(port, "Verbose", "1" if verbose else "0")
+        props = {
+            "AnswerTimeout": timeout_ms,
+            "BaudRate": baud_rate,
+            "DTR": "Enable" if dtr else "Disable",
+            "DataBits": data_bits,
+            "DelayBetweenCharsMs": char_delay_ms,
+            "Fast USB to Serial": "Enable" if fast_usb else "Disable",
+            "Handshaking": "Off" if handshake == "none" else handshake.capitalize(),
+            "Parity": parity.capitalize(),
+            "StopBits": str(stop_bits),
+            "Verbose": "1" if verbose else "0",
+        }
+        for k, v in props.items():
+            core.setProperty(port, k, v)
         # Initialize the configured port.
         core.initializeDevice(port)
 
@@ -14,6 +14,8 @@ class Camera:
         self._flip = flip
         core.loadDevice(name, "AndorSDK3", "Andor sCMOS Camera")
         core.initializeDevice(name)
+        # Binning only changes through our setter so we avoid querying it on every px_len.
+        self._binning = int(core.getProperty(name, "Binning")[-1])
 
     def snap(self) -> np.ndarray:
         self._core.setCameraDevice(self.name)
@@ -30,11 +32,12 @@ class Camera:
 
     @property
     def binning(self) -> int:
-        return int(self._core.getProperty(self.name, "Binning")[-1])
+        return self._binning
 
     @binning.setter
     def binning(self, new_binning: int):
         self._core.setProperty(self.name, "Binning", f"{new_binning}x{new_binning}")
+        self._binning = int(new_binning)
 
     @property
     def exposure(self) -> float:
@@ -0,0 +1,4 @@
+import os
+
+# Run the test suite with runtime type checking enabled.
+os.environ.setdefault("PRISMO_TYPECHECK", "1")
@@ -0,0 +1,76 @@
+import pytest
+
+from prismo.devices import asi
+from prismo.devices.asi import Stage
+
+
+class FakePort:
+    """Replies to ASI commands and records every command sent."""
+
+    def __init__(self):
+        self.commands: list[bytes] = []
+        self.where = b":A 1000.0 -2000.5\r\n"
+
+    def write_readline(self, data: bytes) -> bytes:
+        self.commands.append(data)
+        if data == b"WHERE X Y\r":
+            return self.where
+        return b":A\r\n"
+
+    def close(self):
+        pass
+
+    def queries(self) -> int:
+        return self.commands.count(b"WHERE X Y\r")
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    # Keep cached positions around for the whole test so only moves can invalidate them.
+    monkeypatch.setattr(asi, "XY_CACHE_TTL_S", 60.0)
+    # Skip __init__ since it opens a real serial port.
+    s = Stage.__new__(Stage)
+    s.name = "stage"
+    s._port = FakePort()
+    s._xy_cache = None
+    s._xy_time = 0.0
+    return s
+
+
+def test_reads_share_one_query(stage):
+    """Reading x then y sends a single WHERE query."""
+    assert stage.x == 1000.0
+    assert stage.y == -2000.5
+    assert stage.xy == (1000.0, -2000.5)
+    assert stage._port.queries() == 1
+
+
+@pytest.mark.parametrize(
+    "move",
+    [
+        lambda s: setattr(s, "x", 1.0),
+        lambda s: setattr(s, "y", 1.0),
+        lambda s: setattr(s, "xy", (1.0, 2.0)),
+        lambda s: s.__iadd__((1.0, 2.0)),
+        lambda s: s.__isub__((1.0, 2.0)),
+        lambda s: s.wait(),
+    ],
+    ids=["x", "y", "xy", "iadd", "isub", "wait"],
+)
+def test_moves_force_new_query(stage, move):
+    """Moving or waiting on the stage drops the cached position."""
+    _ = stage.xy
+    move(stage)
+    stage._port.where = b":A 5.0 6.0\r\n"
+
+    assert stage.xy == (5.0, 6.0)
+    assert stage._port.queries() == 2
+
+
+@pytest.mark.parametrize("reply", [b":N-1\r\n", b"garbage\r\n", b":A 12 junk\r\n", b"\r\n"])
+def test_bad_where_reply_raises(stage, reply):
+    """Error and malformed replies to WHERE raise RuntimeError."""
+    stage._port.where = reply
+
+    with pytest.raises(RuntimeError):
+        _ = stage.xy
@@ -1,10 +1,14 @@
+import functools
+import threading
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 from pymmcore import CMMCore
 
-from prismo.control import Control
+import prismo.devices as dev
+from prismo import control
+from prismo.control import Control, _init_devices
 from prismo.devices import protocols
 from prismo.devices.manual import Objective
 
@@ -171,6 +175,15 @@ def test_wait_calls_all_wait_devices(mock_core):
     assert not hasattr(non_wait, "wait") or not non_wait.wait.called
 
 
+def test_setattr_non_device(mock_core):
+    """Attributes that aren't device names can be set freely."""
+    c = Control(mock_core, devices=[])
+
+    c.notes = "x"
+
+    assert c.notes == "x"
+
+
 def test_close_resets_core(mock_core):
     """close() resets the core."""
     c = Control(mock_core, devices=[])
@@ -204,3 +217,106 @@ def test_device_setters(mock_core):
 
     np.testing.assert_array_equal(c.snap(), cam2.snap.return_value)
     assert c.x == 200.0
+
+
+class FakeDevice:
+    def __init__(self, name, *args, **kwargs):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.thread = threading.current_thread()
+
+
+class FakeOtherDevice(FakeDevice):
+    __module__ = "other"
+
+
+class FakeValveDriver(FakeDevice):
+    pass
+
+
+class FakeChip(FakeDevice):
+    pass
+
+
+@pytest.fixture
+def fake_microfluidic(monkeypatch):
+    monkeypatch.setattr(dev.microfluidic, "ValveDriver", FakeValveDriver)
+    monkeypatch.setattr(dev.microfluidic, "Chip", FakeChip)
+
+
+def test_init_devices_keeps_order(mock_core, fake_microfluidic):
+    """Devices are returned in config order."""
+    inits = [
+        functools.partial(FakeDevice, "a", mock_core),
+        functools.partial(FakeValveDriver, "valves"),
+        functools.partial(FakeDevice, "b"),
+        functools.partial(FakeDevice, "c", mock_core),
+    ]
+
+    devices = _init_devices(inits)
+
+    assert [d.name for d in devices] == ["a", "valves", "b", "c"]
+
+
+def test_init_devices_core_on_calling_thread(mock_core, fake_microfluidic):
+    """Devices that use the core are all initialized on the calling thread."""
+    inits = [
+        functools.partial(FakeDevice, "a", mock_core),
+        functools.partial(FakeValveDriver, "valves"),
+        functools.partial(FakeOtherDevice, "b", mock_core),
+    ]
+
+    devices = _init_devices(inits)
+
+    assert devices[0].thread is threading.current_thread()
+    assert devices[2].thread is threading.current_thread()
+
+
+def test_init_devices_chip_uses_preceding_driver(mock_core, fake_microfluidic):
+    """Each chip gets the closest valve driver before it in the config."""
+    inits = [
+        functools.partial(FakeChip, "chip0"),
+        functools.partial(FakeValveDriver, "valves1"),
+        functools.partial(FakeChip, "chip1"),
+        functools.partial(FakeDevice, "other"),
+        functools.partial(FakeValveDriver, "valves2"),
+        functools.partial(FakeChip, "chip2"),
+    ]
+
+    devices = _init_devices(inits)
+
+    assert devices[0].kwargs["driver"] is None
+    assert devices[2].kwargs["driver"] is devices[1]
+    assert devices[5].kwargs["driver"] is devices[4]
+
+
+def test_init_devices_raises_worker_exception(mock_core, fake_microfluidic):
+    """Exceptions raised while initializing a device reach the caller."""
+
+    def broken(name):
+        raise RuntimeError("no device")
+
+    inits = [
+        functools.partial(FakeDevice, "a", mock_core),
+        functools.partial(broken, "b"),
+    ]
+
+    with pytest.raises(RuntimeError, match="no device"):
+        _init_devices(inits)
+
+
+def test_load_raises_worker_exception(monkeypatch, tmp_path):
+    """Exceptions raised while initializing a device reach load()."""
+
+    def broken(name, core, params):
+        def init():
+            raise RuntimeError("no device")
+
+        return functools.partial(init)
+
+    monkeypatch.setitem(control._DEVICES, "broken", broken)
+    monkeypatch.setenv("PATH", "")
+
+    with pytest.raises(RuntimeError, match="no device"):
+        control.load({"demo": "demo_camera", "b": "broken"}, path=str(tmp_path), singleton=False)
@@ -0,0 +1,198 @@
+import struct
+import threading
+from collections import deque
+
+import pytest
+
+from prismo.devices.fluidic import packet
+from prismo.devices.fluidic.fluidic import STEPS_PER_MM, Code, Sipper
+
+_POS = struct.Struct(">qqq")
+
+
+class FakeStream:
+    """Replies to each request with its echoed code and records the order of writes and reads."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.log: list[tuple[str, int]] = []
+        self.requests: list[bytes] = []
+        self.replies: deque[bytes] = deque()
+        self.fail: set[int] = set()
+        self.pos = (0, 0, 0)
+
+    def write(self, request: bytes):
+        code = request[0]
+        self.log.append(("write", code))
+        self.requests.append(bytes(request))
+        if code in self.fail:
+            self.replies.append(bytes([0xFF]))
+        elif code == Code.GET_AIR_IN_LINE:
+            self.replies.append(bytes([code, 1]))
+        elif code == Code.IS_HOMING:
+            self.replies.append(bytes([code, 0]))
+        elif code == Code.GET_POS:
+            self.replies.append(bytes([code]) + _POS.pack(*self.pos))
+        else:
+            if code == Code.SET_POS:
+                self.pos = _POS.unpack(request[1:])
+            elif code == Code.HOME:
+                self.pos = (0, 0, 0)
+            self.replies.append(bytes([code]))
+
+    def read(self) -> bytearray:
+        reply = self.replies.popleft()
+        self.log.append(("read", reply[0]))
+        return bytearray(reply)
+
+    def transact(self, request: bytes) -> bytearray:
+        with self.lock:
+            self.write(request)
+            return self.read()
+
+
+@pytest.fixture
+def sipper(monkeypatch):
+    monkeypatch.setattr(packet, "PacketStream", lambda device_id: FakeStream())
+    s = Sipper("sipper")
+    # Only look at what the tests send, not the setup and homing requests.
+    s._socket.log.clear()
+    s._socket.requests.clear()
+    return s
+
+
+def set_pos(sipper, x, y, z):
+    """Expected SET_POS request for a move to (x, y, z) in plate coordinates."""
+    ox, oy, oz = sipper._origin
+    cnc = (ox - x, y + oy, oz - z)
+    return bytes([Code.SET_POS]) + _POS.pack(*(round(v * STEPS_PER_MM) for v in cnc))
+
+
+def test_batch_defers_replies(sipper):
+    """Setters in a batch are all written before their replies are read in order."""
+    with sipper.batch():
+        sipper.flush_time = 5.0
+        sipper.rms_amps = 0.3
+        assert sipper._socket.log == [
+            ("write", Code.SET_FLUSH_TIME),
+            ("write", Code.SET_RMS_AMPS),
+        ]
+
+    assert sipper._socket.log[2:] == [
+        ("read", Code.SET_FLUSH_TIME),
+        ("read", Code.SET_RMS_AMPS),
+    ]
+    assert sipper._pending is None
+
+
+def test_batch_checks_reply_order(sipper):
+    """Replies that come back out of order are reported."""
+    with pytest.raises(RuntimeError, match="Expected"), sipper.batch():
+        sipper.flush_time = 5.0
+        sipper.rms_amps = 0.3
+        sipper._socket.replies.reverse()
+
+    assert not sipper._socket.replies
+    assert sipper._pending is None
+
+
+def test_getter_drains_pending(sipper):
+    """A getter reads the pending setter replies before sending its own request."""
+    with sipper.batch():
+        sipper.rms_amps = 0.3
+        assert sipper.air is True
+
+    assert sipper._socket.log == [
+        ("write", Code.SET_RMS_AMPS),
+        ("read", Code.SET_RMS_AMPS),
+        ("write", Code.GET_AIR_IN_LINE),
+        ("read", Code.GET_AIR_IN_LINE),
+    ]
+
+
+def test_nested_batch(sipper):
+    """Only the outermost batch reads the replies."""
+    with sipper.batch():
+        sipper.flush_time = 5.0
+        with sipper.batch():
+            sipper.rms_amps = 0.3
+        assert len(sipper._socket.replies) == 2
+        sipper.valve = "flow"
+
+    assert [entry for entry in sipper._socket.log if entry[0] == "read"] == [
+        ("read", Code.SET_FLUSH_TIME),
+        ("read", Code.SET_RMS_AMPS),
+        ("read", Code.SET_VALVE),
+    ]
+    assert sipper._pending is None
+
+
+def test_batch_failure_reads_all_replies(sipper):
+    """A failure mid-batch still reads every reply before raising."""
+    sipper._socket.fail.add(Code.SET_RMS_AMPS)
+
+    with pytest.raises(RuntimeError, match="failure"), sipper.batch():
+        sipper.flush_time = 5.0
+        sipper.rms_amps = 0.3
+        sipper.valve = "flow"
+
+    assert not sipper._socket.replies
+    assert sipper._pending is None
+
+
+def test_well_moves(sipper):
+    """Changing wells lifts the sipper, moves over the well and lowers it."""
+    ox, oy, oz = sipper._origin
+    sipper.well = "B3"
+
+    # Rows count down from the back of the plate, so B is the second row from the top.
+    x, y = 2 * 9.0, 6 * 9.0
+    set_requests = [r for r in sipper._socket.requests if r[0] == Code.SET_POS]
+    assert set_requests == [
+        set_pos(sipper, ox, -oy, oz),
+        set_pos(sipper, x, y, oz),
+        set_pos(sipper, x, y, 0.0),
+    ]
+    assert sipper._xyz == (x, y, 0.0)
+
+
+def test_well_move_reuses_known_position(sipper):
+    """Once the position is known no GET_POS is sent before the first move."""
+    sipper.well = "A1"
+    sipper._socket.requests.clear()
+
+    sipper.well = "H12"
+
+    requests = sipper._socket.requests
+    assert requests[0] == set_pos(sipper, 0.0, 7 * 9.0, sipper._origin[2])
+    assert [r for r in requests if r[0] == Code.SET_POS] == [
+        set_pos(sipper, 0.0, 7 * 9.0, sipper._origin[2]),
+        set_pos(sipper, 11 * 9.0, 0.0, sipper._origin[2]),
+        set_pos(sipper, 11 * 9.0, 0.0, 0.0),
+    ]
+
+
+@pytest.mark.parametrize("well", ["a1", "A01", "a001"])
+def test_well_alternate_names(sipper, well):
+    """Lowercase rows and zero-padded columns name the same well."""
+    sipper.well = well
+
+    assert sipper._xyz == (0.0, 7 * 9.0, 0.0)
+
+
+@pytest.mark.parametrize("well", ["I1", "A13", "A0"])
+def test_well_outside_plate(sipper, well):
+    """Wells past the edge of the plate are rejected without moving."""
+    with pytest.raises(ValueError, match="outside"):
+        sipper.well = well
+
+    assert not sipper._socket.requests
+
+
+@pytest.mark.parametrize("well", ["1A", "AA1", "A", "A1.5", "A-1"])
+def test_well_malformed(sipper, well):
+    """Malformed well names are rejected without moving."""
+    with pytest.raises(ValueError, match="Invalid"):
+        sipper.well = well
+
+    assert not sipper._socket.requests
@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from prismo.devices.fluidic.packet import PacketStream
+
+
+class FakePort:
+    """In-memory port that loops writes back into its receive buffer."""
+
+    def __init__(self):
+        self.rx = bytearray()
+        self.reads = 0
+
+    def write(self, data):
+        self.rx += data
+
+    def read(self, size: int) -> bytes:
+        self.reads += 1
+        out = bytes(self.rx[:size])
+        del self.rx[:size]
+        return out
+
+    def read_until(self, expected: bytes) -> bytes:
+        end = self.rx.find(expected)
+        return self.read(len(self.rx) if end < 0 else end + len(expected))
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def stream():
+    # Skip __init__ since it scans for and probes a real device.
+    s = PacketStream.__new__(PacketStream)
+    s._port = FakePort()
+    s._buf = bytearray()
+    s.lock = threading.RLock()
+    return s
+
+
+@pytest.mark.parametrize("size", [1, 254, 255, 256, 600])
+@pytest.mark.parametrize("zeros", [False, True])
+def test_round_trip(stream, size, zeros):
+    """Packets read back exactly what was written."""
+    if zeros:
+        data = bytes(i * 7 % 256 for i in range(size))
+    else:
+        data = bytes(i % 255 + 1 for i in range(size))
+
+    assert stream.transact(data) == data
+    assert not stream._buf
+    assert not stream._port.rx
+
+
+def test_two_frames_one_read(stream):
+    """Back to back frames are pulled off the port in a single read."""
+    stream.write(b"\x01\x02")
+    stream.write(b"\x03\x00\x04")
+
+    assert stream.read() == b"\x01\x02"
+    assert stream._port.reads == 1
+    assert stream.read() == b"\x03\x00\x04"
+    assert stream._port.reads == 1
+
+
+def test_resync_after_zero_in_frame(stream):
+    """A zero byte inside a frame is reported and the next frame still decodes."""
+    stream._port.rx += b"\x05\x01\x00\x02\x03\x04\x00"
+    stream.write(b"\x0a\x0b")
+
+    with pytest.raises(ValueError, match="zero byte"):
+        stream.read()
+    assert stream.read() == b"\x0a\x0b"
+
+
+def test_timeout_clears_buffer(stream):
+    """A partial frame times out and is dropped rather than prefixed to the next one."""
+    stream._port.rx += b"\x05\x01\x02"
+
+    with pytest.raises(TimeoutError):
+        stream.read()
+    assert not stream._buf
+
+    stream.write(b"\x0a\x0b")
+    assert stream.read() == b"\x0a\x0b"